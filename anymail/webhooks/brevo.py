@@ -31,7 +31,7 @@ class BrevoTrackingWebhookView(BrevoBaseWebhookView):
     signal = tracking
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         if "items" in esp_event:
             # This is an inbound webhook post
             raise AnymailConfigurationError(
@@ -150,7 +150,7 @@ class BrevoInboundWebhookView(BrevoBaseWebhookView):
             self.api_url += "/"
 
     def parse_events(self, request):
-        payload = json.loads(request.body.decode("utf-8"))
+        payload = json.loads(request.body)
         try:
             esp_events = payload["items"]
         except KeyError:
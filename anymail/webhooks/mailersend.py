@@ -69,7 +69,7 @@ class MailerSendTrackingWebhookView(MailerSendBaseWebhookView):
         super().__init__(_secret_name="signing_secret", **kwargs)
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         event_type = esp_event.get("type")
         if event_type == "inbound.message":
             raise AnymailConfigurationError(
@@ -158,7 +158,7 @@ class MailerSendInboundWebhookView(MailerSendBaseWebhookView):
         super().__init__(_secret_name="inbound_secret", **kwargs)
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         event_type = esp_event.get("type")
         if event_type != "inbound.message":
             raise AnymailConfigurationError(
@@ -66,7 +66,7 @@ class MailgunBaseWebhookView(AnymailBaseWebhookView):
         if request.content_type == "application/json":
             # New-style webhook: json payload with separate signature block
             try:
-                event = json.loads(request.body.decode("utf-8"))
+                event = json.loads(request.body)
                 signature_block = event["signature"]
                 token = signature_block["token"]
                 timestamp = signature_block["timestamp"]
@@ -107,7 +107,7 @@ class MailgunTrackingWebhookView(MailgunBaseWebhookView):
 
     def parse_events(self, request):
         if request.content_type == "application/json":
-            esp_event = json.loads(request.body.decode("utf-8"))
+            esp_event = json.loads(request.body)
             return [self.esp_to_anymail_event(esp_event)]
         else:
             return [self.mailgun_legacy_to_anymail_event(request.POST)]
@@ -420,7 +420,7 @@ class MailgunInboundWebhookView(MailgunBaseWebhookView):
 
     def parse_events(self, request):
         if request.content_type == "application/json":
-            esp_event = json.loads(request.body.decode("utf-8"))
+            esp_event = json.loads(request.body)
             event_type = esp_event.get("event-data", {}).get("event", "")
             raise AnymailConfigurationError(
                 "You seem to have set Mailgun's *%s tracking* webhook "
@@ -20,7 +20,7 @@ class MailjetTrackingWebhookView(AnymailBaseWebhookView):
     signal = tracking
 
     def parse_events(self, request):
-        esp_events = json.loads(request.body.decode("utf-8"))
+        esp_events = json.loads(request.body)
         # Mailjet webhook docs say the payload is "a JSON array of event objects,"
         # but that's not true if "group events" isn't enabled in webhook config...
         try:
@@ -125,7 +125,7 @@ class MailjetInboundWebhookView(AnymailBaseWebhookView):
     signal = inbound
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         return [self.esp_to_anymail_event(esp_event)]
 
     def esp_to_anymail_event(self, esp_event):
@@ -92,7 +92,7 @@ class PostalTrackingWebhookView(PostalBaseWebhookView):
     signal = tracking
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
 
         if "rcpt_to" in esp_event:
             raise AnymailConfigurationError(
@@ -178,7 +178,7 @@ class PostalInboundWebhookView(PostalBaseWebhookView):
     signal = inbound
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
 
         if "status" in esp_event:
             raise AnymailConfigurationError(
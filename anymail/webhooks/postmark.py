@@ -23,7 +23,7 @@ class PostmarkBaseWebhookView(AnymailBaseWebhookView):
     esp_name = "Postmark"
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         return [self.esp_to_anymail_event(esp_event)]
 
     def esp_to_anymail_event(self, esp_event):
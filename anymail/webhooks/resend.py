@@ -77,7 +77,7 @@ class ResendTrackingWebhookView(SvixWebhookValidationMixin, AnymailBaseWebhookVi
     signal = tracking
 
     def parse_events(self, request):
-        esp_event = json.loads(request.body.decode("utf-8"))
+        esp_event = json.loads(request.body)
         return [self.esp_to_anymail_event(esp_event, request)]
 
     # https://resend.com/docs/dashboard/webhooks/event-types
@@ -22,7 +22,7 @@ class SendGridTrackingWebhookView(AnymailBaseWebhookView):
     signal = tracking
 
     def parse_events(self, request):
-        esp_events = json.loads(request.body.decode("utf-8"))
+        esp_events = json.loads(request.body)
         return [self.esp_to_anymail_event(esp_event) for esp_event in esp_events]
 
     event_types = {
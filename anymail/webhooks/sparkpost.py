@@ -22,7 +22,7 @@ class SparkPostBaseWebhookView(AnymailBaseWebhookView):
     esp_name = "SparkPost"
 
     def parse_events(self, request):
-        raw_events = json.loads(request.body.decode("utf-8"))
+        raw_events = json.loads(request.body)
         unwrapped_events = [self.unwrap_event(raw_event) for raw_event in raw_events]
         return [
             self.esp_to_anymail_event(event_class, event, raw_event)
@@ -76,7 +76,7 @@ class UnisenderGoTrackingWebhookView(AnymailBaseWebhookView):
         if hasattr(request, "_parsed_json"):
             parsed = getattr(request, "_parsed_json")
         else:
-            parsed = json.loads(request.body.decode())
+            parsed = json.loads(request.body)
             setattr(request, "_parsed_json", parsed)
         return parsed
 